@@ -0,0 +1,103 @@
+"""
+_curves.py
+
+Shared emission-curve data for the report scripts: pool size, schedule
+length, and the three candidate K curves. The normalized weight table is
+baked in as a generated constant, so importing this module does no
+exponential work at all — the curves are a literal load and one scale.
+"""
+
+import math
+
+import numpy as np
+
+try:  # optional fast path for K sweeps; the reports never require it
+    from numba import njit
+except ImportError:
+    njit = None
+
+POOL = 133_000_000  # staking rewards pool ($FIGHT)
+DAYS = 20
+K_VALUES = (0.05, 0.10, 0.15)
+
+# Normalized emission weights (rows follow K_VALUES, columns are days,
+# each row sums to 1), generated from _compute_weights(). K_VALUES, DAYS
+# and this table must change together; regenerate the literal with:
+#
+#     python reports/_curves.py
+#
+_W = np.array([
+    [0.029838583826498326, 0.0313684407335908, 0.032976735081608324,
+     0.03466748844414408, 0.036444928585278494, 0.03831350003119162,
+     0.040277875183793645, 0.042342966004163395, 0.04451393629500956,
+     0.0467962146128672, 0.04919550784231661, 0.05171781546616748,
+     0.05436944456729078, 0.05715702559961124, 0.06008752896769578,
+     0.06316828245639565, 0.06640698955412541, 0.0698117487155966,
+     0.07339107361217272, 0.0771539144204823],
+    [0.016461104183018566, 0.018192333622485516, 0.020105638051500785,
+     0.0222201664638738, 0.024557081770673127, 0.027139772605753565,
+     0.029994087407064985, 0.033148593116507225, 0.03663486108748639,
+     0.04048778306163115, 0.04474592037707055, 0.04945188990326689,
+     0.05465279056496932, 0.06040067472408323, 0.06675306913720364,
+     0.0737735507027305, 0.08153238275983703, 0.0901072183075842,
+     0.09958387718223562, 0.11005720497102389],
+    [0.008479417863883369, 0.00985167803266161, 0.011446016886680262,
+     0.013298374361791302, 0.015450506706149019, 0.017950927758706905,
+     0.02085600255880735, 0.024231217939251076, 0.028152658744833758,
+     0.03270872295359171, 0.03800211436339544, 0.04415215776346914,
+     0.05129748877993986, 0.05959917903050403, 0.06924436703613303,
+     0.0804504767386249, 0.09347011871874962, 0.10859678459932116,
+     0.12617146299767878, 0.14659032616582776],
+])
+
+assert _W.shape == (len(K_VALUES), DAYS), "stale _W: regenerate the table"
+
+curves = POOL * _W
+
+
+def _compute_weights():
+    """Normalized emission weights for the K_VALUES candidates.
+
+    One vectorized pass: the normalization is a max-shifted softmax done
+    in place, so the exponents stay bounded in (0, 1] no matter how large
+    K * DAYS grows and the work array is reused throughout. Only used to
+    (re)generate the baked _W table above.
+    """
+    d = np.arange(DAYS)
+    K = np.array(K_VALUES)[:, None]
+    Z = K * d
+    Z -= Z.max(axis=1, keepdims=True)
+    W = np.exp(Z, out=Z)
+    W /= W.sum(axis=1, keepdims=True)
+    return W
+
+
+def compute_curve(k):
+    """Daily emissions for a single decay constant ``k``.
+
+    The module-level ``curves`` covers the three shipped candidates; this
+    helper is for sweeping many K values when tuning the curve, where a
+    fused exp-and-accumulate loop beats building NumPy temporaries per
+    call. JIT-compiled (cached across runs) when numba is installed; the
+    plain-Python body is the fallback.
+    """
+    w = np.empty(DAYS)
+    s = 0.0
+    for day in range(DAYS):
+        w[day] = math.exp(k * day)
+        s += w[day]
+    return w * (POOL / s)
+
+
+if njit is not None:
+    compute_curve = njit(cache=True, fastmath=True)(compute_curve)
+
+
+if __name__ == "__main__":
+    # Emit a fresh _W literal (exact repr round-trip) for pasting above.
+    print("_W = np.array([")
+    for row in _compute_weights():
+        reprs = [repr(v) for v in row.tolist()]
+        print("    [" + ",\n     ".join(", ".join(reprs[i:i + 3])
+                                        for i in range(0, DAYS, 3)) + "],")
+    print("])")
@@ -0,0 +1,48 @@
+"""
+generate_all.py
+
+Render the full emission report — chart panels on top, day-by-day table
+below — as one combined figure in a single render/encode pass, instead
+of paying figure setup and PNG encoding once per script.
+
+Usage:
+    python reports/generate_all.py
+
+Output:
+    reports/emission-report.png
+"""
+
+import os
+
+import matplotlib
+
+matplotlib.use("Agg")  # save-only workload: skip GUI backend probing
+import matplotlib.pyplot as plt
+from matplotlib.transforms import Bbox
+
+from generate_chart import BG, build_chart
+from generate_table import build_table
+
+OUT_PATH = os.path.join(os.path.dirname(__file__), "emission-report.png")
+FIGSIZE = (16, 19)  # inches
+
+
+def main():
+    fig = plt.figure(figsize=FIGSIZE)
+    fig.patch.set_facecolor(BG)
+
+    # Both builders draw in normalized (sub)figure coordinates, so each
+    # gets its own subfigure row and the whole report renders in one pass.
+    gs = fig.add_gridspec(2, 1, height_ratios=[6, 13])
+    build_chart(fig.add_subfigure(gs[0]))
+    build_table(fig.add_subfigure(gs[1]))
+
+    facecolor = fig.get_facecolor()
+    fig.savefig(OUT_PATH, dpi=150, facecolor=facecolor,
+                bbox_inches=Bbox.from_bounds(0, 0, *FIGSIZE), pad_inches=0,
+                pil_kwargs={"compress_level": 6, "optimize": False})
+    print(f"Wrote {OUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()